@@ -1 +1,19 @@
 # TODO: Add image analysis endpoints
+# TODO: Index analysis IDs per image_id (appended in creation order) so image history
+#       reads only that image's analyses instead of scanning and sorting all of storage
+# TODO: Bound concurrent analysis runs (asyncio.Semaphore sized by
+#       settings.MAX_CONCURRENT_ANALYSES) instead of firing unbounded background tasks
+# TODO: Cache storage image URLs per image_id with a TTL shorter than the URL signer expiry;
+#       drop the entry when the image is deleted
+# TODO: Upload detection masks concurrently (asyncio.gather behind a small semaphore) and
+#       overlap the visualization upload with them rather than awaiting each in turn
+# TODO: Fetch/delete by ID with a single lookup (.get / .pop), then 404 on a miss
+# TODO: Build AnalysisResponse from the ML result dict with one model_validate call rather
+#       than constructing nested BoundingBox/DetectionResult models per detection; if
+#       detections need reshaping, unpack each result once and validate the whole list
+#       with a module-level TypeAdapter(list[DetectionResult])
+# TODO: Until results live in PostgreSQL, keep in-memory stores bounded (TTLCache sized by
+#       settings.ANALYSIS_CACHE_SIZE / ANALYSIS_TTL_SEC) rather than plain dicts. The
+#       per-image index gets the same bound: image_index is a TTLCache with the same size and
+#       TTL, and image history skips ids no longer in analysis_storage (.get, never [aid])
+#       and prunes them from the list
@@ -1 +1,8 @@
 # TODO: Add health check endpoint
+# TODO: Timestamp with datetime.now(timezone.utc) (utcnow is deprecated); /live can return
+#       a static module-level payload
+# TODO: Memoize each dependency probe for ~1s (single-flight per probe) so bursts of
+#       load-balancer checks trigger one real check
+# TODO: Probes should ping the service (one round trip), not import its module per call
+# TODO: Run the dependency probes in /health and /ready concurrently with
+#       asyncio.gather(..., return_exceptions=True), treating exceptions as unhealthy
@@ -1 +1,16 @@
 # TODO: Add image management endpoints
+# TODO: Keep base64 decoding and image validation off the event loop (plain `def` handler
+#       or asyncio.to_thread) so large uploads don't stall other requests
+# TODO: Share a private _persist_image(image_bytes, ...) between the base64 and multipart
+#       upload endpoints; multipart must not re-encode to base64 just to decode it again
+# TODO: Read width/height from the image header during the magic-byte check instead of
+#       decoding the whole image with PIL: PNG IHDR chunk, JPEG SOF marker, WebP VP8 /
+#       VP8L / VP8X chunk header
+# TODO: Have validate_image_data return the detected format ("jpeg" / "png" / "webp") so
+#       callers don't re-check the magic bytes
+# TODO: Fetch/delete by ID with a single lookup (.get / .pop), then 404 on a miss
+# TODO: Stream multipart uploads to storage in chunks, enforcing the max size on a running
+#       count instead of buffering the whole file. Buffer only the header needed for the
+#       format + dimension check before streaming starts: 24 bytes for PNG, 30 for WebP,
+#       and for JPEG everything up to the end of the first SOF segment (past EXIF/ICC APP
+#       segments), capped at 256 KB; reject with 400 if no SOF appears within the cap
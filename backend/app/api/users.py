@@ -1 +1,23 @@
 # TODO: Add user auth endpoints
+# TODO: Hash passwords with a salted KDF (hashlib.scrypt, per-user random salt stored with
+#       the hash), never a single fast digest with a global pepper
+# TODO: Look users up by lowercased email through an index (unique index on lower(email) in
+#       PostgreSQL), not by scanning every stored user
+# TODO: Issue JWTs with integer epoch iat/exp from one time.time() call
+# TODO: Key token revocation entries by a 16-byte BLAKE2b digest of the JWT, not the token
+# TODO: Store users and token revocations in PostgreSQL so every worker sees a logout:
+#       revoked_tokens(token_digest, expires_at = token exp) with a periodic job deleting
+#       expired rows; only the short decoded-JWT cache stays in process
+# TODO: Return UserResponse/Token models directly; the app-wide ORJSONResponse handles
+#       encoding, so don't pass them through jsonable_encoder
+# TODO: verify_password re-derives the raw digest and compares with hmac.compare_digest
+# TODO: Build UserResponse for stored (already validated) users with model_construct
+# TODO: Cache decoded JWT payloads briefly (~60s TTL, never past exp); still check
+#       revocation on every request
+# TODO: Generate user IDs with app.core.ids.new_id()
+# TODO: Let unexpected errors propagate to the global exception handler in main.py instead
+#       of wrapping register/login in try/except Exception
+# TODO: Bulk user import (seeding/migration) hashes passwords in a ThreadPoolExecutor;
+#       hashlib.scrypt releases the GIL, so this scales across cores
+# TODO: Enforce email uniqueness with the database unique index (handle the violation as
+#       409) rather than check-then-insert in application code
@@ -1 +1,6 @@
 # TODO: Add Settings class with pydantic-settings
+# TODO: Add MAX_CONCURRENT_ANALYSES (default 2) to cap in-flight ML inference
+# TODO: Add ANALYSIS_CACHE_SIZE and ANALYSIS_TTL_SEC for any in-process result caches
+# TODO: Expose one module-level `settings` instance; callers read its attributes directly
+#       (plain instance lookups) rather than copying values into module constants
+# TODO: Add optional SAM_TRT_ENGINE_PATH (prebuilt TensorRT engine for the SAM encoder)
@@ -0,0 +1,25 @@
+"""
+Time-ordered ID generation for stored records
+"""
+
+import os
+import time
+import uuid
+
+
+def new_id() -> str:
+    """Return a new UUIDv7 string (millisecond timestamp prefix, random tail).
+
+    IDs created in different milliseconds sort by creation time (as long as the
+    wall clock doesn't step backwards); IDs within the same millisecond are in
+    random order. That is enough to keep B-tree inserts near-sequential once
+    records move into PostgreSQL UUID primary keys.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= ((rand >> 62) & 0xFFF) << 64  # rand_a
+    value |= 0b10 << 62  # RFC 9562 variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b
+    return str(uuid.UUID(int=value))
@@ -1,19 +1,46 @@
 """
 U-CHS Backend - Main Application Entry Point
 """
-from fastapi import FastAPI
+
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown"""
+    # TODO: Load and warm ML models here (get_ml_service() + one dummy analysis) so the
+    #       first user request doesn't pay model load / compile time
+    yield
+    # TODO: Close the storage service's shared HTTP client
+
 
 app = FastAPI(
     title="U-CHS API",
     version="0.1.0",
     description="Universal Crop Health Scanner API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+
 @app.get("/")
 async def root():
     return {"message": "U-CHS API - TODO: Implement"}
 
-# TODO: Add CORS middleware
+
+# TODO: Add CORS middleware. The Exception handler below runs in ServerErrorMiddleware,
+#       outside CORS, so 500 responses won't carry CORS headers unless added there
 # TODO: Include routers (health, analysis, images, users)
-# TODO: Add startup/shutdown events
-# TODO: Add global exception handler
+
+
+@app.exception_handler(Exception)
+async def global_exception_handler(request: Request, exc: Exception):
+    """Return a generic 500; the server re-raises and logs the traceback itself"""
+    logger.error("Unhandled error on %s %s: %r", request.method, request.url.path, exc)
+    return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
@@ -1 +1,9 @@
 # TODO: Add Pydantic models (AnalysisResponse, ImageUpload, etc.)
+# TODO: Stored and hot-path response models (AnalysisResponse, DetectionResult, BoundingBox,
+#       SegmentationMask, ImageMetadata, UserResponse, Token) use
+#       ConfigDict(frozen=True, extra="ignore")
+# TODO: BoundingBox (frozen) computes (x1, y1, x2, y2) once in model_post_init into a
+#       PrivateAttr that to_xyxy/x2/y2 read; private attrs are allowed on frozen models and
+#       are not serialized, so the response schema stays x/y/width/height
+# TODO: UserCreate password validator checks digit/upper/lower in a single pass over the
+#       string, stopping once all three are seen
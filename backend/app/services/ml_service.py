@@ -1 +1,40 @@
 # TODO: Implement SAM + Grounding DINO inference
+# TODO: Build model_info once in MLService.__init__ (read-only MappingProxyType) and reuse it
+#       for every analysis instead of rebuilding it per task
+# TODO: Put SAM in eval() and run it under torch.inference_mode() with CUDA autocast:
+#       bf16 if torch.cuda.is_bf16_supported(), else fp16 (pre-Ampere GPUs such as T4);
+#       enable TF32 and cudnn.benchmark on compute capability >= 8
+# TODO: Segment all detections in one SamPredictor.predict_torch call with an (N, 4) box
+#       tensor (transform.apply_boxes_torch) instead of one predict per box
+# TODO: Keep a small LRU (~8 entries) of SAM image embeddings keyed by a BLAKE2b digest of
+#       the image bytes so re-analysing an image with new prompts skips the encoder
+# TODO: Decode uploads with cv2.imdecode(np.frombuffer(...)) + cvtColor(BGR2RGB), not
+#       PIL.Image.open + np.array
+# TODO: Compile the SAM image encoder at load time with torch.compile, then run one dummy
+#       1x3x1024x1024 forward under the same inference_mode() and autocast dtype as serving
+#       (compilation is lazy and Dynamo guards on grad/autocast state); if that warm-up
+#       forward raises, fall back to the eager encoder
+# TODO: Optional TensorRT path: when settings.SAM_TRT_ENGINE_PATH is set, load the engine
+#       behind a predictor wrapper with the same set_image/predict_torch API
+# TODO: Demo results describe masks as rectangles ({"type": "rect", "bbox": ...}) with
+#       area = (x2 - x1) * (y2 - y1), drawn only when visualizing
+# TODO: Visualization paints every mask into one overlay buffer and alpha-blends once
+#       (single cv2.addWeighted), not once per detection
+# TODO: Store detection masks packed (np.packbits + shape, or COCO RLE if pycocotools is
+#       installed) and unpack only for drawing/upload
+# TODO: Encode visualizations as JPEG via cv2.imencode(".jpg", ..., [IMWRITE_JPEG_QUALITY, 85])
+# TODO: If profiling shows allocation churn on large images, pool visualization scratch
+#       arrays by (shape, dtype) behind a config flag (off by default)
+# TODO: get_ml_service() is a @functools.lru_cache(maxsize=1) factory, not a global + None check
+# TODO: analyze_image keeps the event loop free: plain CPU decode/encode may use
+#       asyncio.to_thread, but all GPU/SamPredictor work runs through a module-level
+#       ThreadPoolExecutor(max_workers=1) via loop.run_in_executor, since the shared predictor
+#       holds per-image state (features, sizes, is_image_set) and must not be used concurrently
+# TODO: Cache Grounding DINO text embeddings per tuple(sorted(prompts)) (LRU, ~64 entries)
+#       so repeated prompt sets skip tokenization and the text encoder
+# TODO: On CUDA, feed SAM via set_torch_image from a pinned host tensor
+#       (torch.from_numpy(...).pin_memory(), .to(device, non_blocking=True)) after ResizeLongestSide
+# TODO: Return native Python values in detections: bboxes via one boxes_tensor.tolist(),
+#       scores/areas via .item() / int(), never per-element numpy scalars. Required, not
+#       just faster: FastAPI's jsonable_encoder raises on np.float32/ndarray before
+#       ORJSONResponse.render runs
@@ -1 +1,16 @@
 # TODO: Implement Supabase/S3 storage
+# TODO: upload_visualization takes a content_type (visualizations are JPEG)
+# TODO: create_thumbnail decodes with cv2.imdecode, resizes with INTER_AREA (aspect ratio
+#       preserved) and encodes JPEG at quality 85, with no PIL on this path
+# TODO: Async upload/download methods must not call the sync boto3/supabase SDKs directly:
+#       use httpx.AsyncClient for the Supabase Storage REST API, asyncio.to_thread for boto3
+# TODO: Add upload_analysis(image, thumbnail, visualization, masks) that uploads all parts
+#       concurrently with asyncio.gather and returns their URLs keyed by part
+# TODO: get_storage_service() is a @functools.lru_cache(maxsize=1) factory
+# TODO: Derive extensions with PurePosixPath(filename).suffix.lstrip(".").lower() or "jpg",
+#       checked against a frozenset allowlist; take the date folder from the caller so
+#       one analysis' image, masks and visualization share a prefix
+# TODO: Hold one long-lived httpx.AsyncClient (base_url = Supabase storage, auth headers,
+#       httpx.Limits(max_connections=64, max_keepalive_connections=32)) reused for every call
+# TODO: Add upload_mask_tensor(mask, image_id, detection_id): scale to uint8 on device, copy
+#       to CPU once, cv2.imencode(".png", ..., [IMWRITE_PNG_COMPRESSION, 1]), then upload
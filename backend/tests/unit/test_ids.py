@@ -0,0 +1,28 @@
+import time
+import uuid
+
+from app.core import ids
+from app.core.ids import new_id
+
+
+def test_new_id_is_rfc_uuid7():
+    """Test version and variant bits"""
+    value = uuid.UUID(new_id())
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_new_id_embeds_millisecond_timestamp(monkeypatch):
+    """Test the 48-bit timestamp prefix"""
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_123_456_789)
+    assert uuid.UUID(new_id()).int >> 80 == 1_700_000_000_123
+
+
+def test_new_id_sorts_across_milliseconds(monkeypatch):
+    """Test IDs from later milliseconds sort after earlier ones"""
+    now_ns = time.time_ns()
+    generated = []
+    for step_ms in range(50):
+        monkeypatch.setattr(ids.time, "time_ns", lambda: now_ns + step_ms * 1_000_000)
+        generated.append(new_id())
+    assert sorted(generated) == generated
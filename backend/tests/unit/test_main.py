@@ -0,0 +1,30 @@
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def test_default_response_class_is_orjson():
+    """Test routes render JSON with orjson by default"""
+    assert app.router.default_response_class is ORJSONResponse
+
+
+def test_openapi_servers_follow_root_path():
+    """Test the OpenAPI schema advertises the root path the app is served under"""
+    with TestClient(app, root_path="/api") as client:
+        schema = client.get("/openapi.json").json()
+    assert schema["servers"] == [{"url": "/api"}]
+
+
+def test_unhandled_error_returns_generic_500():
+    """Test the global exception handler hides error details"""
+
+    @app.get("/_test/raise")
+    async def raise_error():
+        raise RuntimeError("secret failure detail")
+
+    client = TestClient(app, raise_server_exceptions=False)
+    response = client.get("/_test/raise")
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal server error"}
+    assert "secret failure detail" not in response.text